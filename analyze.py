@@ -17,49 +17,255 @@ License: MIT
 """
 
 import logging
+import operator
+from array import array
 from collections import Counter
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Tuple, Union
 
-# Optional: Sentiment analysis (install with: pip install textblob)
+# Optional: Lexicon sentiment analysis (install with: pip install vaderSentiment)
+# Preferred over TextBlob: tuned for social media text and much cheaper per call
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    VADER_AVAILABLE = True
+except ImportError:
+    VADER_AVAILABLE = False
+
+# Optional: Sentiment analysis fallback (install with: pip install textblob)
 try:
     from textblob import TextBlob
     TEXTBLOB_AVAILABLE = True
 except ImportError:
     TEXTBLOB_AVAILABLE = False
 
+# Optional: Vectorized aggregation (install with: pip install numpy)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Basic stop words filtered out of keyword extraction
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "must", "shall", "can", "this",
+    "that", "these", "those", "i", "you", "he", "she", "it", "we", "they",
+    "what", "which", "who", "when", "where", "why", "how", "all", "each",
+    "every", "both", "few", "more", "most", "other", "some", "such", "no",
+    "not", "only", "same", "so", "than", "too", "very", "just", "also",
+})
+
+# Per-text memoization size; reposts and cross-posts with identical text
+# reuse the earlier result instead of being analyzed again
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Single shared VADER analyzer; its lexicon is loaded once at import
+_SENTIMENT_ANALYZER = SentimentIntensityAnalyzer() if VADER_AVAILABLE else None
+
+# Punctuation stripped from the edges of each whitespace-separated token
+_EDGE_PUNCT = ".,!?\"'()[]{}"
+
+# ============================================================================
+# POST DATA TABLE (COLUMNAR STORAGE)
+# ============================================================================
+
+
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+def _int64(value: Any) -> int:
+    """Return value as an int that fits a PostTable int64 column."""
+    value = operator.index(value)
+    if not _INT64_MIN <= value <= _INT64_MAX:
+        raise OverflowError(f"{value} does not fit in a 64-bit integer column")
+    return value
+
+
+class PostTable:
+    """
+    Column-oriented store for anonymized post data.
+
+    Holds the fields produced by main.extract_post_data as parallel columns
+    instead of one dict per post. Numeric columns are compact typed arrays,
+    so aggregate metrics can be computed straight from contiguous buffers.
+    Body text is packed as UTF-8 into one shared buffer indexed by offsets,
+    rather than kept as one str object per post.
+
+    PRIVACY NOTE: Same fields as extract_post_data - no author information.
+    """
+
+    __slots__ = (
+        "ids", "created_utc", "titles", "selftext_buffer", "selftext_offsets",
+        "scores", "num_comments", "upvote_ratios", "subreddits",
+    )
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.created_utc: List[str] = []
+        self.titles: List[str] = []
+        self.selftext_buffer = bytearray()
+        # selftext i is selftext_buffer[selftext_offsets[i]:selftext_offsets[i + 1]]
+        self.selftext_offsets = array("q", [0])
+        self.scores = array("q")
+        self.num_comments = array("q")
+        self.upvote_ratios = array("d")
+        self.subreddits: List[str] = []
+
+    @classmethod
+    def from_posts(cls, posts: List[Dict[str, Any]]) -> "PostTable":
+        """Build a table from a list of post data dictionaries."""
+        table = cls()
+        for post_data in posts:
+            table.append(post_data)
+        return table
+
+    def append(self, post_data: Dict[str, Any]) -> None:
+        """
+        Append one post data dictionary (missing fields default to empty/0).
+
+        score and num_comments are stored as int64 counts, as the Reddit API
+        returns them. Non-integer values raise TypeError and values outside
+        the int64 range raise OverflowError, rather than being truncated; use
+        a list of dicts with calculate_trend_metrics for arbitrary numbers.
+        All fields are validated before any column is touched, so a rejected
+        row leaves the table unchanged.
+        """
+        score = _int64(post_data.get("score", 0))
+        num_comments = _int64(post_data.get("num_comments", 0))
+        upvote_ratio = float(post_data.get("upvote_ratio", 0.0))
+        selftext = post_data.get("selftext", "").encode("utf-8")
+
+        self.ids.append(post_data.get("id", ""))
+        self.created_utc.append(post_data.get("created_utc", ""))
+        self.titles.append(post_data.get("title", ""))
+        self.selftext_buffer += selftext
+        self.selftext_offsets.append(len(self.selftext_buffer))
+        self.scores.append(score)
+        self.num_comments.append(num_comments)
+        self.upvote_ratios.append(upvote_ratio)
+        self.subreddits.append(post_data.get("subreddit", ""))
+
+    def selftext(self, index: int) -> str:
+        """Return the body text of the post at index."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PostTable index out of range")
+        start, end = self.selftext_offsets[index], self.selftext_offsets[index + 1]
+        return str(memoryview(self.selftext_buffer)[start:end], "utf-8")
+
+    def iter_selftexts(self) -> Iterator[str]:
+        """
+        Yield each post's body text in order.
+
+        Each row is decoded from a fresh slice, so no memoryview stays
+        exported between yields and the table can be appended to while a
+        partly consumed iterator is alive.
+        """
+        buffer = self.selftext_buffer
+        offsets = self.selftext_offsets
+        for i in range(len(offsets) - 1):
+            yield buffer[offsets[i]:offsets[i + 1]].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
 # ============================================================================
 # TEXT ANALYSIS FUNCTIONS (LOCAL PROCESSING ONLY)
 # ============================================================================
 
 
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _sentiment_scores(text: str) -> Tuple[float, float]:
+    """Return (polarity, subjectivity) from the best available backend."""
+    if VADER_AVAILABLE:
+        # VADER has no subjectivity score; use the sentiment-bearing share
+        # pos + neg. (Not 1 - neu: VADER reports neu == 0 for empty text,
+        # which would score an empty post as fully subjective.)
+        scores = _SENTIMENT_ANALYZER.polarity_scores(text)
+        return scores["compound"], scores["pos"] + scores["neg"]
+
+    blob = TextBlob(text)
+    return blob.sentiment.polarity, blob.sentiment.subjectivity
+
+
 def analyze_sentiment(text: str) -> Dict[str, float]:
     """
     Perform basic sentiment analysis on text.
 
-    Uses TextBlob for simple polarity/subjectivity scoring.
+    Uses VADER lexicon scoring when available, falling back to TextBlob.
+    Results are memoized per text, so duplicate posts are scored once.
     All processing is done locally - no external API calls.
 
+    With VADER, polarity is the compound score and subjectivity is the
+    share of the text carrying positive or negative sentiment.
+
     Args:
         text: Input text to analyze
 
     Returns:
         dict: Sentiment scores (polarity: -1 to 1, subjectivity: 0 to 1)
     """
-    if not TEXTBLOB_AVAILABLE:
-        logger.warning("TextBlob not installed. Skipping sentiment analysis.")
+    if not (VADER_AVAILABLE or TEXTBLOB_AVAILABLE):
+        logger.warning("VADER/TextBlob not installed. Skipping sentiment analysis.")
         return {"polarity": 0.0, "subjectivity": 0.0}
 
-    blob = TextBlob(text)
-    return {
-        "polarity": blob.sentiment.polarity,
-        "subjectivity": blob.sentiment.subjectivity,
-    }
+    polarity, subjectivity = _sentiment_scores(text)
+    return {"polarity": polarity, "subjectivity": subjectivity}
+
+
+def analyze_sentiments_batch(texts: List[str]) -> List[Dict[str, float]]:
+    """
+    Perform sentiment analysis on many texts in one call.
+
+    Warns at most once per batch if no backend is installed (rather than
+    once per text), and shares the per-text memoization with
+    analyze_sentiment, so duplicate texts in or across batches are scored
+    once. There is no batch_size: the lexicon backends score one text at a
+    time, so there is nothing to chunk or dispatch in groups.
+    All processing is done locally - no external API calls.
+
+    Args:
+        texts: Input texts to analyze
+
+    Returns:
+        list: Sentiment score dicts, in the same order as texts
+    """
+    if not (VADER_AVAILABLE or TEXTBLOB_AVAILABLE):
+        logger.warning("VADER/TextBlob not installed. Skipping sentiment analysis.")
+        return [{"polarity": 0.0, "subjectivity": 0.0} for _ in texts]
+
+    results = []
+    for text in texts:
+        polarity, subjectivity = _sentiment_scores(text)
+        results.append({"polarity": polarity, "subjectivity": subjectivity})
+    return results
+
+
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _top_keywords(text: str, top_n: int) -> Tuple[str, ...]:
+    """Memoized core of extract_keywords (returns an immutable tuple)."""
+    # Strip and stop-word filtering are fused into one generator feeding
+    # Counter, so no intermediate lists are built
+    stripped = (w.strip(_EDGE_PUNCT) for w in text.lower().split())
+    words = (w for w in stripped if len(w) > 2 and w not in _STOP_WORDS)
+
+    # Count and return top N
+    word_counts = Counter(words)
+    return tuple(word for word, count in word_counts.most_common(top_n))
 
 
 def extract_keywords(text: str, top_n: int = 10) -> List[str]:
@@ -67,7 +273,7 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
     Extract most common meaningful words from text.
 
     Simple keyword extraction using word frequency.
-    Filters out common stop words.
+    Filters out common stop words. Results are memoized per text.
 
     Args:
         text: Input text
@@ -76,36 +282,22 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
     Returns:
         list: Most frequent meaningful words
     """
-    # Basic stop words to filter out
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-        "being", "have", "has", "had", "do", "does", "did", "will", "would",
-        "could", "should", "may", "might", "must", "shall", "can", "this",
-        "that", "these", "those", "i", "you", "he", "she", "it", "we", "they",
-        "what", "which", "who", "when", "where", "why", "how", "all", "each",
-        "every", "both", "few", "more", "most", "other", "some", "such", "no",
-        "not", "only", "same", "so", "than", "too", "very", "just", "also",
-    }
+    return list(_top_keywords(text, top_n))
 
-    # Tokenize and filter
-    words = text.lower().split()
-    words = [w.strip(".,!?\"'()[]{}") for w in words]
-    words = [w for w in words if w and len(w) > 2 and w not in stop_words]
 
-    # Count and return top N
-    word_counts = Counter(words)
-    return [word for word, count in word_counts.most_common(top_n)]
-
-
-def calculate_trend_metrics(posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+def calculate_trend_metrics(
+    posts: Union[List[Dict[str, Any]], PostTable],
+) -> Dict[str, Any]:
     """
     Calculate aggregate trend metrics from post data.
 
     PRIVACY NOTE: All metrics are aggregated - no individual user data.
 
     Args:
-        posts: List of post data dictionaries
+        posts: List of post data dictionaries, or a PostTable (whose
+            numeric columns are reduced directly, without per-post lookups).
+            Dict values may be any numbers (ints, floats, big ints) and are
+            summed exactly as given.
 
     Returns:
         dict: Aggregated metrics (averages, totals, trends)
@@ -114,13 +306,27 @@ def calculate_trend_metrics(posts: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {"error": "No posts to analyze"}
 
     total_posts = len(posts)
-    total_score = sum(p.get("score", 0) for p in posts)
-    total_comments = sum(p.get("num_comments", 0) for p in posts)
+
+    if isinstance(posts, PostTable) and NUMPY_AVAILABLE:
+        # Zero-copy views over the int64 columns, reduced in C
+        total_score = int(np.frombuffer(posts.scores, dtype=np.int64).sum())
+        total_comments = int(np.frombuffer(posts.num_comments, dtype=np.int64).sum())
+    elif isinstance(posts, PostTable):
+        total_score = sum(posts.scores)
+        total_comments = sum(posts.num_comments)
+    else:
+        # Plain sums: converting dicts to arrays first costs more than it
+        # saves, and keeps whatever numeric types the dicts hold
+        total_score = sum(p.get("score", 0) for p in posts)
+        total_comments = sum(p.get("num_comments", 0) for p in posts)
+
+    average_score = total_score / total_posts
+    average_comments = total_comments / total_posts
 
     return {
         "total_posts": total_posts,
-        "average_score": total_score / total_posts,
-        "average_comments": total_comments / total_posts,
+        "average_score": average_score,
+        "average_comments": average_comments,
         "total_engagement": total_score + total_comments,
     }
 
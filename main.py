@@ -4,12 +4,13 @@ Reddit Peptide Discussion Trend Analyzer
 =========================================
 
 A read-only tool for analyzing public discussion trends in peptide-related
-subreddits using the official Reddit API via PRAW.
+subreddits using the official Reddit OAuth API (raw JSON listings).
 
 COMPLIANCE NOTICE:
 - This script performs READ-ONLY operations only
 - No posting, voting, commenting, or any write operations
 - Respects Reddit's rate limits (1-2 second delays between requests)
+- Subreddits are fetched concurrently under one shared rate limiter
 - Uses proper User-Agent identification
 - For personal, non-commercial research only
 
@@ -17,14 +18,25 @@ Author: dreday2050
 License: MIT
 """
 
+import os
 import time
+import shelve
+import asyncio
 import logging
 import argparse
-from datetime import datetime, timezone
-from typing import Generator, Optional
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
-import praw
-from praw.models import Submission, Comment
+import httpx
+
+# Optional: Faster JSON parsing of listing pages (install with: pip install orjson)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 # ============================================================================
 # CONFIGURATION - Import from config.py (see config.example.py for template)
@@ -54,6 +66,8 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
+# httpx logs every request at INFO; keep the transparency log to our own messages
+logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -70,35 +84,222 @@ TARGET_SUBREDDITS = [
 # Reddit allows ~60 requests/minute; we're conservative at ~30/minute
 REQUEST_DELAY_SECONDS = 2.0
 
+# Posts returned per listing request; each page is one HTTP call
+LISTING_PAGE_SIZE = 100
+
 # Maximum items to fetch per request (Reddit's max is typically 100)
 DEFAULT_FETCH_LIMIT = 25
 
+# Posts fetched per subreddit by production mode's sample run
+SAMPLE_FETCH_LIMIT = 10
+
+# Reddit OAuth endpoints (application-only auth, read-only listing access)
+REDDIT_TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+REDDIT_API_BASE_URL = "https://oauth.reddit.com"
+
+# Seconds to wait for any single HTTP request before giving up
+HTTP_TIMEOUT_SECONDS = 30.0
+
+# Retries for a request rejected with HTTP 429 (Too Many Requests)
+RATE_LIMIT_MAX_RETRIES = 3
+
+# Local cache of anonymized post data, so repeated runs don't re-hit the API
+CACHE_PATH = "data/cache"
+CACHE_TTL_SECONDS = 30 * 60
+
 # ============================================================================
 # REDDIT CLIENT INITIALIZATION
 # ============================================================================
 
 
-def create_reddit_client() -> praw.Reddit:
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Listing paths per sort method, with any extra query parameters
+_LISTING_SORTS = {
+    "new": ("new", {}),
+    "hot": ("hot", {}),
+    "top": ("top", {"t": "week"}),
+    "rising": ("rising", {}),
+}
+
+
+class RedditAuthError(RuntimeError):
+    """Raised when Reddit's token endpoint does not return a usable token."""
+
+
+def _header_float(headers: httpx.Headers, name: str) -> Optional[float]:
+    """Parse a numeric response header, or return None if absent/invalid."""
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+class RedditClient:
+    """
+    Minimal read-only client for Reddit's OAuth listing endpoints.
+
+    Authenticates with an application-only token (client credentials
+    grant - no username/password), which carries no user context and
+    cannot perform write operations. Listing pages are fetched as raw
+    JSON, skipping per-post model objects.
+
+    Besides the shared RateLimiter, the client honours Reddit's own
+    signals: HTTP 429 responses are retried after Retry-After (or
+    X-Ratelimit-Reset, or an exponential backoff), and when
+    X-Ratelimit-Remaining reaches zero all requests pause until the
+    reported reset.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, user_agent: str):
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._http = httpx.AsyncClient(
+            headers={"User-Agent": user_agent},
+            timeout=HTTP_TIMEOUT_SECONDS,
+        )
+        self.read_only = False
+        # time.monotonic() before which no request may be sent
+        self._blocked_until = 0.0
+
+    async def authenticate(self) -> None:
+        """
+        Obtain and validate an application-only OAuth2 bearer token.
+
+        read_only is only set once the response is confirmed to be a bearer
+        token from the client-credentials grant, which has no user attached.
+
+        Raises:
+            RedditAuthError: The token endpoint returned an error payload
+                (Reddit may do so with HTTP 200) or no bearer access token
+        """
+        response = await self._http.post(
+            REDDIT_TOKEN_URL,
+            auth=(self._client_id, self._client_secret),
+            data={"grant_type": "client_credentials"},
+        )
+        response.raise_for_status()
+        token = _json_loads(response.content)
+
+        if not isinstance(token, dict):
+            raise RedditAuthError("Unexpected token response from Reddit")
+        if "error" in token:
+            raise RedditAuthError(f"Reddit rejected the token request: {token['error']}")
+        if not token.get("access_token"):
+            raise RedditAuthError("Token response from Reddit has no access_token")
+        if str(token.get("token_type", "")).lower() != "bearer":
+            raise RedditAuthError(
+                f"Unexpected token_type from Reddit: {token.get('token_type')!r}"
+            )
+
+        self._http.headers["Authorization"] = f"bearer {token['access_token']}"
+        # Validated client-credentials bearer token: no user context
+        self.read_only = True
+
+    def _note_rate_limit(self, response: httpx.Response, attempt: int) -> None:
+        """Pause future requests according to Reddit's rate-limit signals."""
+        headers = response.headers
+        wait = None
+        if response.status_code == 429:
+            wait = (
+                _header_float(headers, "Retry-After")
+                or _header_float(headers, "X-Ratelimit-Reset")
+                or REQUEST_DELAY_SECONDS * 2 ** attempt
+            )
+        else:
+            remaining = _header_float(headers, "X-Ratelimit-Remaining")
+            if remaining is not None and remaining < 1:
+                wait = _header_float(headers, "X-Ratelimit-Reset")
+
+        if wait:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + wait)
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """GET with Reddit rate-limit handling and HTTP 429 retries."""
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            delay = self._blocked_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            response = await self._http.get(url, params=params)
+            self._note_rate_limit(response, attempt)
+            if response.status_code != 429:
+                break
+            if attempt < RATE_LIMIT_MAX_RETRIES:
+                logger.warning(
+                    f"Rate limited by Reddit (HTTP 429); retry {attempt + 1} "
+                    f"of {RATE_LIMIT_MAX_RETRIES} in "
+                    f"{max(self._blocked_until - time.monotonic(), 0):.1f}s..."
+                )
+
+        response.raise_for_status()
+        return response
+
+    async def get_listing(
+        self,
+        subreddit_name: str,
+        sort: str,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch one page of a subreddit listing (READ-ONLY GET request).
+
+        Args:
+            subreddit_name: Name of the subreddit (without r/)
+            sort: Sort method - one of the keys of _LISTING_SORTS
+            limit: Number of posts to request (at most LISTING_PAGE_SIZE)
+            after: Fullname of the last post on the previous page
+
+        Returns:
+            tuple: (raw post data dicts, fullname cursor for the next page)
+        """
+        path, extra_params = _LISTING_SORTS[sort]
+        params = {"limit": limit, "raw_json": 1, **extra_params}
+        if after:
+            params["after"] = after
+
+        response = await self._get(
+            f"{REDDIT_API_BASE_URL}/r/{subreddit_name}/{path}", params
+        )
+        listing = _json_loads(response.content)["data"]
+
+        posts = [child["data"] for child in listing["children"]]
+        return posts, listing.get("after")
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+
+async def create_reddit_client() -> RedditClient:
     """
     Initialize and return a read-only Reddit client.
 
     The client is configured with:
-    - Proper OAuth2 authentication
+    - Proper OAuth2 authentication (application-only)
     - Descriptive User-Agent (required by Reddit)
     - Read-only mode (no write operations possible)
 
+    The caller is responsible for closing the client (``await reddit.close()``).
+
     Returns:
-        praw.Reddit: Authenticated Reddit client instance
+        RedditClient: Authenticated Reddit client instance
     """
     logger.info("Initializing Reddit client (read-only mode)...")
 
-    reddit = praw.Reddit(
+    reddit = RedditClient(
         client_id=REDDIT_CLIENT_ID,
         client_secret=REDDIT_CLIENT_SECRET,
         user_agent=REDDIT_USER_AGENT,
         # NOTE: No username/password = script runs in read-only mode
         # This is intentional - we only need to read public data
     )
+    try:
+        await reddit.authenticate()
+    except Exception:
+        await reddit.close()
+        raise
 
     # Verify read-only status
     logger.info(f"Client initialized. Read-only mode: {reddit.read_only}")
@@ -106,61 +307,96 @@ def create_reddit_client() -> praw.Reddit:
     return reddit
 
 
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+
+class RateLimiter:
+    """
+    Enforce a minimum interval between Reddit API requests.
+
+    A single instance is shared by every concurrent fetch, so the combined
+    request rate stays at one request per interval no matter how many
+    subreddits are processed at once.
+    """
+
+    def __init__(self, interval: float = REQUEST_DELAY_SECONDS):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
+    async def wait(self) -> None:
+        """Block until the next request slot is available, then claim it."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_request_at - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request_at = max(now, self._next_request_at) + self.interval
+
+
 # ============================================================================
 # DATA FETCHING FUNCTIONS (READ-ONLY)
 # ============================================================================
 
 
-def fetch_subreddit_posts(
-    reddit: praw.Reddit,
+def normalize_sort(sort: str) -> str:
+    """Return sort if it is a supported listing sort, else 'new' (with a warning)."""
+    if sort not in _LISTING_SORTS:
+        logger.warning(f"Unknown sort '{sort}', defaulting to 'new'")
+        return "new"
+    return sort
+
+
+async def fetch_subreddit_posts(
+    reddit: RedditClient,
     subreddit_name: str,
+    rate_limiter: RateLimiter,
     sort: str = "new",
     limit: int = DEFAULT_FETCH_LIMIT,
-) -> Generator[Submission, None, None]:
+) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Fetch posts from a subreddit using the specified sort method.
 
     This is a READ-ONLY operation that retrieves publicly available posts.
-    Rate limiting is enforced between requests.
+    Rate limiting is enforced before every listing page request.
 
     Args:
         reddit: Authenticated Reddit client
         subreddit_name: Name of the subreddit (without r/)
+        rate_limiter: Limiter shared by all concurrent fetches
         sort: Sort method - 'new', 'hot', 'top', 'rising'
         limit: Maximum number of posts to fetch
 
     Yields:
-        Submission: Individual post objects
+        dict: Raw post data from the listing JSON
 
     Note:
         - Only public data is accessed
         - No user-specific or private data is collected
         - Rate limits are respected with built-in delays
     """
+    sort = normalize_sort(sort)
     logger.info(f"Fetching {limit} '{sort}' posts from r/{subreddit_name}...")
 
-    subreddit = reddit.subreddit(subreddit_name)
-
-    # Select the appropriate listing based on sort method
-    if sort == "new":
-        posts = subreddit.new(limit=limit)
-    elif sort == "hot":
-        posts = subreddit.hot(limit=limit)
-    elif sort == "top":
-        posts = subreddit.top(limit=limit, time_filter="week")
-    elif sort == "rising":
-        posts = subreddit.rising(limit=limit)
-    else:
-        logger.warning(f"Unknown sort '{sort}', defaulting to 'new'")
-        posts = subreddit.new(limit=limit)
+    fetched = 0
+    after = None
+    while fetched < limit:
+        # RATE LIMITING: Each listing page is one HTTP request
+        await rate_limiter.wait()
+        page_size = min(LISTING_PAGE_SIZE, limit - fetched)
+        posts, after = await reddit.get_listing(subreddit_name, sort, page_size, after)
 
-    for post in posts:
-        yield post
-        # RATE LIMITING: Wait between requests to respect Reddit's limits
-        time.sleep(REQUEST_DELAY_SECONDS)
+        for post in posts[:limit - fetched]:
+            fetched += 1
+            yield post
 
+        if not posts or after is None:
+            break
 
-def extract_post_data(post: Submission) -> dict:
+
+def extract_post_data(post: Dict[str, Any]) -> dict:
     """
     Extract relevant public data from a post for analysis.
 
@@ -168,24 +404,141 @@ def extract_post_data(post: Submission) -> dict:
     User-specific data (like usernames) is NOT stored for analysis.
 
     Args:
-        post: A Reddit Submission object
+        post: Raw post data from a listing page
 
     Returns:
         dict: Anonymized post data for trend analysis
     """
     return {
-        "id": post.id,
-        "created_utc": datetime.fromtimestamp(post.created_utc, tz=timezone.utc).isoformat(),
-        "title": post.title,
-        "selftext": post.selftext[:500] if post.selftext else "",  # Truncate for efficiency
-        "score": post.score,
-        "num_comments": post.num_comments,
-        "upvote_ratio": post.upvote_ratio,
-        "subreddit": str(post.subreddit),
+        "id": post["id"],
+        "created_utc": datetime.fromtimestamp(post["created_utc"], tz=timezone.utc).isoformat(),
+        "title": post["title"],
+        "selftext": post["selftext"][:500] if post.get("selftext") else "",  # Truncate for efficiency
+        "score": post["score"],
+        "num_comments": post["num_comments"],
+        "upvote_ratio": post["upvote_ratio"],
+        "subreddit": post["subreddit"],
         # NOTE: We do NOT store author/username information
     }
 
 
+# ============================================================================
+# LOCAL CACHE
+# ============================================================================
+
+
+class PostCache:
+    """
+    TTL cache of extracted post data, persisted locally with shelve.
+
+    Entries are keyed on (subreddit, sort, limit) and hold the anonymized
+    dicts produced by extract_post_data, so a hit needs no API request.
+
+    PRIVACY NOTE: Only anonymized post data is cached, and only on the
+    local machine (same guarantees as local storage). Expired entries are
+    deleted from disk, not just skipped: whenever one is found, the shelf
+    is rewritten from scratch so no stale post text lingers in the file.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, ttl: float = CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.cache: Dict[str, Tuple[float, List[dict]]] = {}
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with shelve.open(path) as db:
+            self.cache.update(db.items())
+        if self._drop_expired():
+            self._rewrite()
+
+    @staticmethod
+    def make_key(subreddit_name: str, sort: str, limit: int) -> str:
+        """Build the cache key for one listing request."""
+        return f"{subreddit_name}:{sort}:{limit}"
+
+    def _expired(self, entry: Tuple[float, List[dict]]) -> bool:
+        return time.time() - entry[0] > self.ttl
+
+    def _drop_expired(self) -> bool:
+        """Remove expired entries from memory; return True if any were found."""
+        expired = [key for key, entry in self.cache.items() if self._expired(entry)]
+        for key in expired:
+            del self.cache[key]
+        return bool(expired)
+
+    def _rewrite(self) -> None:
+        """Recreate the shelf with only the live entries (flag 'n' truncates)."""
+        with shelve.open(self.path, flag="n") as db:
+            db.update(self.cache)
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        """Return cached post data for key, or None if missing or expired."""
+        entry = self.cache.get(key)
+        if entry is None or self._expired(entry):
+            return None
+        return entry[1]
+
+    def set(self, key: str, posts: List[dict]) -> None:
+        """Store post data for key in memory and on disk, purging expired entries."""
+        self.cache[key] = (time.time(), posts)
+        if self._drop_expired():
+            self._rewrite()
+        else:
+            with shelve.open(self.path) as db:
+                db[key] = self.cache[key]
+
+
+async def fetch_subreddit_post_data(
+    reddit: Optional[RedditClient],
+    subreddit_name: str,
+    rate_limiter: RateLimiter,
+    cache: Optional[PostCache] = None,
+    sort: str = "new",
+    limit: int = DEFAULT_FETCH_LIMIT,
+) -> AsyncGenerator[dict, None]:
+    """
+    Yield anonymized post data, serving from the local cache when fresh.
+
+    On a cache miss, posts are fetched via fetch_subreddit_posts (rate
+    limited as usual) and the full listing is cached once consumed.
+
+    Args:
+        reddit: Authenticated Reddit client, or None if every listing is
+            expected to be cached (a miss then raises RuntimeError)
+        subreddit_name: Name of the subreddit (without r/)
+        rate_limiter: Limiter shared by all concurrent fetches
+        cache: Post cache, or None to always hit the API
+        sort: Sort method - 'new', 'hot', 'top', 'rising'
+        limit: Maximum number of posts to fetch
+
+    Yields:
+        dict: Anonymized post data (see extract_post_data)
+    """
+    # Normalize first so an unknown sort shares the 'new' cache entry
+    sort = normalize_sort(sort)
+    key = PostCache.make_key(subreddit_name, sort, limit)
+
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached '{sort}' posts for r/{subreddit_name} (no API request)")
+            for post_data in cached:
+                yield post_data
+            return
+
+    if reddit is None:
+        raise RuntimeError(f"Cache miss for r/{subreddit_name} but no Reddit client available")
+
+    fetched = []
+    async for post in fetch_subreddit_posts(reddit, subreddit_name, rate_limiter, sort, limit):
+        post_data = extract_post_data(post)
+        fetched.append(post_data)
+        yield post_data
+
+    if cache is not None:
+        cache.set(key, fetched)
+
+
 # ============================================================================
 # LOCAL STORAGE (Stub for future implementation)
 # ============================================================================
@@ -223,7 +576,13 @@ def save_to_local_storage(post_data: dict, storage_path: str = "data/posts.json"
 # DEMO MODE - Simulates API behavior without credentials
 # ============================================================================
 
-DEMO_POSTS = [
+# Demo timestamps are fixed offsets from a constant epoch, stored as ISO
+# strings (the format extract_post_data produces). No clock reads at import
+# and no conversion in run_demo_mode; demo output is the same on every run.
+_DEMO_BASE = datetime.fromtimestamp(1_700_000_000, tz=timezone.utc)
+
+# Read-only demo data: a tuple of read-only mappings
+DEMO_POSTS = tuple(MappingProxyType(post) for post in (
     {
         "id": "demo001",
         "title": "BPC-157 healing protocol - 8 week update with results",
@@ -231,7 +590,7 @@ DEMO_POSTS = [
         "score": 245,
         "num_comments": 87,
         "upvote_ratio": 0.94,
-        "created_utc": datetime.now().timestamp() - 86400,
+        "created_utc": (_DEMO_BASE - timedelta(days=1)).isoformat(),
     },
     {
         "id": "demo002",
@@ -240,7 +599,7 @@ DEMO_POSTS = [
         "score": 189,
         "num_comments": 62,
         "upvote_ratio": 0.91,
-        "created_utc": datetime.now().timestamp() - 172800,
+        "created_utc": (_DEMO_BASE - timedelta(days=2)).isoformat(),
     },
     {
         "id": "demo003",
@@ -249,7 +608,7 @@ DEMO_POSTS = [
         "score": 312,
         "num_comments": 45,
         "upvote_ratio": 0.97,
-        "created_utc": datetime.now().timestamp() - 259200,
+        "created_utc": (_DEMO_BASE - timedelta(days=3)).isoformat(),
     },
     {
         "id": "demo004",
@@ -258,7 +617,7 @@ DEMO_POSTS = [
         "score": 156,
         "num_comments": 93,
         "upvote_ratio": 0.89,
-        "created_utc": datetime.now().timestamp() - 345600,
+        "created_utc": (_DEMO_BASE - timedelta(days=4)).isoformat(),
     },
     {
         "id": "demo005",
@@ -267,17 +626,21 @@ DEMO_POSTS = [
         "score": 278,
         "num_comments": 34,
         "upvote_ratio": 0.96,
-        "created_utc": datetime.now().timestamp() - 432000,
+        "created_utc": (_DEMO_BASE - timedelta(days=5)).isoformat(),
     },
-]
+))
 
 
-def run_demo_mode():
+def run_demo_mode(realistic_timing: bool = False):
     """
     Run in demo mode without Reddit API credentials.
 
     Demonstrates the code structure and data flow using simulated data.
     Useful for reviewers to verify code behavior without live API access.
+
+    Args:
+        realistic_timing: Actually sleep for the rate-limit delay. Off by
+            default, since no requests are made; the delay is only logged.
     """
     logger.info("=" * 60)
     logger.info("Reddit Peptide Trend Analyzer - DEMO MODE")
@@ -291,15 +654,17 @@ def run_demo_mode():
     subreddit_name = "Peptides"
     logger.info(f"--- Processing r/{subreddit_name} (DEMO) ---")
 
-    for i, demo_post in enumerate(DEMO_POSTS):
-        # Simulate rate limiting behavior
-        logger.info(f"[Rate limit: waiting {REQUEST_DELAY_SECONDS}s...]")
+    # Simulate rate limiting: all demo posts fit in one listing page,
+    # so production mode would wait once before a single request
+    logger.info(f"[Rate limit: waiting {REQUEST_DELAY_SECONDS}s before listing request...]")
+    if realistic_timing:
         time.sleep(REQUEST_DELAY_SECONDS)
 
+    for demo_post in DEMO_POSTS:
         # Process demo post
         post_data = {
             "id": demo_post["id"],
-            "created_utc": datetime.fromtimestamp(demo_post["created_utc"], tz=timezone.utc).isoformat(),
+            "created_utc": demo_post["created_utc"],
             "title": demo_post["title"],
             "selftext": demo_post["selftext"][:500],
             "score": demo_post["score"],
@@ -325,11 +690,124 @@ def run_demo_mode():
     logger.info("=" * 60)
 
 
+# ============================================================================
+# PRODUCTION MODE - Live, read-only API access
+# ============================================================================
+
+
+async def process_subreddit(
+    reddit: Optional[RedditClient],
+    subreddit_name: str,
+    rate_limiter: RateLimiter,
+    cache: Optional[PostCache] = None,
+) -> int:
+    """
+    Fetch and log sample posts from one subreddit.
+
+    Args:
+        reddit: Authenticated Reddit client, or None on a fully cached run
+        subreddit_name: Name of the subreddit (without r/)
+        rate_limiter: Limiter shared by all concurrent fetches
+        cache: Post cache, or None to always hit the API
+
+    Returns:
+        int: Number of posts processed
+    """
+    logger.info(f"\n--- Processing r/{subreddit_name} ---")
+
+    posts_processed = 0
+    async for post_data in fetch_subreddit_post_data(
+        reddit, subreddit_name, rate_limiter, cache, limit=SAMPLE_FETCH_LIMIT
+    ):
+        # Log basic info (anonymized)
+        logger.info(
+            f"Post: {post_data['title'][:50]}... | "
+            f"Score: {post_data['score']} | "
+            f"Comments: {post_data['num_comments']}"
+        )
+
+        posts_processed += 1
+
+    logger.info(f"Processed {posts_processed} posts from r/{subreddit_name}")
+    return posts_processed
+
+
+async def run_production_mode(use_cache: bool = True):
+    """
+    Fetch sample data from all target subreddits concurrently.
+
+    All subreddits share one rate limiter, so concurrency overlaps network
+    latency without raising the overall request rate. The cache is checked
+    before authenticating: if every target is cached, no network request is
+    made at all and no credentials are needed.
+
+    Args:
+        use_cache: Serve recent results from the local post cache
+    """
+    logger.info("=" * 60)
+    logger.info("Reddit Peptide Trend Analyzer - Starting")
+    logger.info("Mode: READ-ONLY | Commercial Use: NO")
+    logger.info("=" * 60)
+
+    cache = PostCache() if use_cache else None
+    needs_api = cache is None or any(
+        cache.get(PostCache.make_key(subreddit_name, "new", SAMPLE_FETCH_LIMIT)) is None
+        for subreddit_name in TARGET_SUBREDDITS
+    )
+
+    # Initialize client (only if some listing actually has to be fetched)
+    reddit = None
+    if needs_api:
+        if not CONFIG_AVAILABLE:
+            print_config_help()
+            exit(1)
+        reddit = await create_reddit_client()
+    else:
+        logger.info("All target subreddits are cached - no API connection needed.")
+
+    try:
+        # Verify we're in read-only mode
+        if reddit is not None and not reddit.read_only:
+            logger.error("Client is not in read-only mode. Exiting for safety.")
+            return
+
+        # Fetch and display sample data
+        rate_limiter = RateLimiter()
+        # return_exceptions=True: one failing subreddit must not leave its
+        # siblings running against a client that is about to be closed
+        results = await asyncio.gather(
+            *(
+                process_subreddit(reddit, subreddit_name, rate_limiter, cache)
+                for subreddit_name in TARGET_SUBREDDITS
+            ),
+            return_exceptions=True,
+        )
+        for subreddit_name, result in zip(TARGET_SUBREDDITS, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to process r/{subreddit_name}: {result!r}")
+    finally:
+        if reddit is not None:
+            await reddit.close()
+
+    logger.info("\n" + "=" * 60)
+    logger.info("Execution complete. No write operations performed.")
+    logger.info("=" * 60)
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
 
+def print_config_help():
+    """Explain how to provide API credentials when config.py is missing."""
+    print("ERROR: config.py not found. Copy config.example.py to config.py")
+    print("       and fill in your Reddit API credentials.")
+    print("")
+    print("TIP: Run with --demo flag to see the code in action without credentials:")
+    print("     python main.py --demo")
+
+
 def main():
     """
     Main execution function.
@@ -338,8 +816,10 @@ def main():
     All operations are logged for transparency.
 
     Usage:
-        python main.py           # Normal mode (requires config.py)
-        python main.py --demo    # Demo mode (no credentials needed)
+        python main.py                            # Normal mode (requires config.py)
+        python main.py --demo                     # Demo mode (no credentials needed)
+        python main.py --demo --realistic-timing  # Demo with real rate-limit waits
+        python main.py --no-cache                 # Skip the local post cache
     """
     parser = argparse.ArgumentParser(
         description="Reddit Peptide Trend Analyzer - Read-only research tool"
@@ -349,63 +829,31 @@ def main():
         action="store_true",
         help="Run in demo mode with simulated data (no API credentials needed)"
     )
+    parser.add_argument(
+        "--realistic-timing",
+        action="store_true",
+        help="In demo mode, actually wait for simulated rate-limit delays"
+    )
     parser.add_argument(
         "--subreddit",
         type=str,
         default="Peptides",
         help="Target subreddit to analyze (default: Peptides)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore the local post cache at {CACHE_PATH} and always fetch from the API"
+    )
     args = parser.parse_args()
 
     # Demo mode - no credentials needed
     if args.demo:
-        run_demo_mode()
+        run_demo_mode(realistic_timing=args.realistic_timing)
         return
 
-    # Production mode - requires credentials
-    if not CONFIG_AVAILABLE:
-        print("ERROR: config.py not found. Copy config.example.py to config.py")
-        print("       and fill in your Reddit API credentials.")
-        print("")
-        print("TIP: Run with --demo flag to see the code in action without credentials:")
-        print("     python main.py --demo")
-        exit(1)
-
-    logger.info("=" * 60)
-    logger.info("Reddit Peptide Trend Analyzer - Starting")
-    logger.info("Mode: READ-ONLY | Commercial Use: NO")
-    logger.info("=" * 60)
-
-    # Initialize client
-    reddit = create_reddit_client()
-
-    # Verify we're in read-only mode
-    if not reddit.read_only:
-        logger.error("Client is not in read-only mode. Exiting for safety.")
-        return
-
-    # Fetch and display sample data
-    for subreddit_name in TARGET_SUBREDDITS:
-        logger.info(f"\n--- Processing r/{subreddit_name} ---")
-
-        posts_processed = 0
-        for post in fetch_subreddit_posts(reddit, subreddit_name, limit=10):
-            post_data = extract_post_data(post)
-
-            # Log basic info (anonymized)
-            logger.info(
-                f"Post: {post_data['title'][:50]}... | "
-                f"Score: {post_data['score']} | "
-                f"Comments: {post_data['num_comments']}"
-            )
-
-            posts_processed += 1
-
-        logger.info(f"Processed {posts_processed} posts from r/{subreddit_name}")
-
-    logger.info("\n" + "=" * 60)
-    logger.info("Execution complete. No write operations performed.")
-    logger.info("=" * 60)
+    # Production mode - requires credentials unless every listing is cached
+    asyncio.run(run_production_mode(use_cache=not args.no_cache))
 
 
 if __name__ == "__main__":
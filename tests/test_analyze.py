@@ -0,0 +1,50 @@
+"""Tests for the local analysis module (analyze.py)."""
+
+import unittest
+
+from analyze import PostTable, calculate_trend_metrics
+
+
+class PostTableAppendTest(unittest.TestCase):
+    def setUp(self):
+        self.table = PostTable()
+        self.table.append({"id": "a", "title": "first", "selftext": "body", "score": 1, "num_comments": 3})
+
+    def assert_unchanged(self):
+        self.assertEqual(len(self.table), 1)
+        for column in (self.table.ids, self.table.created_utc, self.table.titles,
+                       self.table.scores, self.table.num_comments,
+                       self.table.upvote_ratios, self.table.subreddits):
+            self.assertEqual(len(column), 1)
+        self.assertEqual(len(self.table.selftext_offsets), 2)
+        self.assertEqual(self.table.selftext(0), "body")
+        self.assertEqual(calculate_trend_metrics(self.table)["average_score"], 1.0)
+
+    def test_non_integer_score_leaves_table_unchanged(self):
+        with self.assertRaises(TypeError):
+            self.table.append({"id": "b", "title": "second", "selftext": "more", "score": 1.5})
+        self.assert_unchanged()
+
+    def test_out_of_range_count_leaves_table_unchanged(self):
+        with self.assertRaises(OverflowError):
+            self.table.append({"id": "b", "title": "second", "num_comments": 2 ** 70})
+        self.assert_unchanged()
+
+
+
+class PostTableSelftextTest(unittest.TestCase):
+    def test_append_while_iterating_selftexts(self):
+        table = PostTable.from_posts([{"id": "a", "selftext": "one"}, {"id": "b", "selftext": "two"}])
+        texts = table.iter_selftexts()
+        self.assertEqual(next(texts), "one")
+
+        table.append({"id": "c", "selftext": "three"})
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(len(table.selftext_offsets), 4)
+        self.assertEqual(list(texts), ["two"])
+        self.assertEqual(table.selftext(2), "three")
+
+
+if __name__ == "__main__":
+    unittest.main()